@@ -1,292 +1,374 @@
 import streamlit as st
 import pandas as pd
-import altair as alt
+import numpy as np
 import importlib.util
-import re
+import os
+import textwrap
 import datetime
 from zoneinfo import ZoneInfo
 
 
-def check_openpyxl():
-    if importlib.util.find_spec("openpyxl") is None:
-        st.error("Missing optional dependency 'openpyxl'. Please install it via pip: pip install openpyxl")
+@st.cache_resource
+def excel_engine():
+    # Prefer the faster calamine reader and fall back to openpyxl.
+    # The answer can't change while the server runs, so only search sys.path once.
+    for engine, module in (("calamine", "python_calamine"), ("openpyxl", "openpyxl")):
+        if importlib.util.find_spec(module) is not None:
+            return engine
+    return None
+
+
+def check_excel_engine():
+    if excel_engine() is None:
+        st.error("Missing optional dependency 'python-calamine'. Please install it via pip: pip install python-calamine")
         st.stop()
 
 
-def is_date_format(x):
-    # Check if string matches MM/DD/YYYY format
-    return bool(re.match(r'\d{2}/\d{2}/\d{4}$', str(x)))
+# Bump whenever load_peaks changes what it stores in the parquet copy
+PARQUET_VERSION = 3
+
+PEAK_COLUMNS = ['Agents Peak', 'Calls Peak', 'Calls Peak (Inbound)', 'Calls Peak (Outbound)']
+
+
+@st.cache_data(show_spinner=False)
+def load_peaks(path, mtime):
+    # Returns the cleaned frame and its formatted date range.
+    # mtime is part of the cache key so a replaced workbook is re-read.
+    # The cleaned sheet is kept as a parquet file next to the workbook so
+    # cold starts skip the Excel parse until the workbook changes. The file
+    # name carries PARQUET_VERSION so copies in an older layout are ignored,
+    # and the copy records the workbook's exact mtime and size so it is only
+    # reused for that same file (a replacement with an older mtime still misses).
+    parquet_path = f"{os.path.splitext(path)[0]}.v{PARQUET_VERSION}.parquet"
+    stat = os.stat(path)
+    source = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    df = None
+    if os.path.exists(parquet_path):
+        try:
+            df = pd.read_parquet(parquet_path, engine="pyarrow")
+        except (OSError, ValueError):
+            # A damaged copy is just a cache miss; parse the workbook again
+            df = None
+        if df is not None and df.attrs.get("source") != source:
+            df = None
+    if df is None:
+        df = pd.read_excel(
+            path,
+            engine=excel_engine(),
+            usecols=['Date'] + PEAK_COLUMNS
+        )
+        
+        # Convert to datetime; non-date rows (e.g. the summary row) become NaT and are dropped
+        df['Date'] = pd.to_datetime(df['Date'], format='%m/%d/%Y', errors='coerce')
+        df = df.dropna(subset=['Date']).reset_index(drop=True)
+        
+        # Write to a per-process temp file and swap it in, so readers never see a partial copy
+        tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+        # pandas stores attrs in the parquet metadata and restores them on read
+        df.attrs["source"] = source
+        try:
+            df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+            os.replace(tmp_path, parquet_path)
+        except OSError:
+            # Read-only deployments just go without the on-disk copy
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    df.attrs.clear()
+    
+    # Narrowest types that hold the data: second-resolution dates and the smallest integer per
+    # count column (columns with blank cells stay float). Applied after both branches
+    # since parquet can't store datetime64[s].
+    df['Date'] = df['Date'].astype('datetime64[s]')
+    df[PEAK_COLUMNS] = df[PEAK_COLUMNS].apply(pd.to_numeric, downcast='integer')
+
+    if df.empty:
+        return df, None, None
+    min_date, max_date = (d.strftime('%m/%d/%Y') for d in df['Date'].agg(['min', 'max']))
+    return df, min_date, max_date
+
+
+EST = ZoneInfo("America/New_York")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def last_updated():
+    # Minute resolution, so one formatted string per minute is enough
+    return datetime.datetime.now(EST).strftime('%m/%d/%Y %I:%M %p EST')
+
+
+# Number of rows shown in the data table
+PREVIEW_ROWS = 200
+
+# Above this many rows the time-series charts are plotted from weekly peaks
+MAX_CHART_POINTS = 5000
+
+
+def chart_data(df):
+    # Returns the frame to plot and its resolution ("Daily" or "Weekly") for the chart titles.
+    # Long histories are resampled in pandas so Vega doesn't have to draw every day.
+    if len(df) <= MAX_CHART_POINTS:
+        return df, "Daily"
+    weekly = df.resample('W', on='Date')[PEAK_COLUMNS].max().dropna()
+    # Empty weeks turn the counts into float64; restore the narrow integer types
+    return weekly.astype(df[PEAK_COLUMNS].dtypes.to_dict()).reset_index(), "Weekly"
+
+
+@st.cache_data(show_spinner=False)
+def hover_line_spec(y_field, y_title, title, color=None, fold=None):
+    # Vega-Lite spec for a line chart that shows a rule and value label at the hovered date.
+    # With fold, the listed wide columns are reshaped in the browser into (color field, y_field) pairs.
+    line_mark = {"type": "line"}
+    if color is None:
+        line_mark["color"] = "#1f77b4"
+    encoding = {
+        "x": {"field": "Date", "type": "temporal", "title": "Date"},
+        "y": {"field": y_field, "type": "quantitative", "title": y_title},
+    }
+    if color is not None:
+        encoding["color"] = color
+    # Only keep the rule and label rows for the hovered date
+    nearest_filter = {"filter": {"param": "nearest", "empty": False}}
+
+    spec = {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": title,
+        "width": 800,
+        "height": 400,
+        "layer": [
+            {"mark": line_mark, "encoding": encoding},
+            {
+                # Transparent points that pick the date nearest the cursor
+                "mark": {"type": "point", "size": 100},
+                "encoding": {**encoding, "opacity": {"value": 0}},
+                "params": [{
+                    "name": "nearest",
+                    "select": {"type": "point", "fields": ["Date"], "nearest": True, "on": "mouseover"},
+                }],
+            },
+            {
+                "mark": {"type": "rule", "color": "gray"},
+                "encoding": {"x": {"field": "Date", "type": "temporal"}},
+                "transform": [nearest_filter],
+            },
+            {
+                "mark": {"type": "text", "align": "left", "dx": 5, "dy": -5, "fontSize": 12},
+                "encoding": {
+                    **encoding,
+                    "text": {
+                        "condition": {"param": "nearest", "empty": False, "field": y_field,
+                                      "type": "quantitative", "format": ".0f"},
+                        "value": " ",
+                    },
+                },
+                "transform": [nearest_filter],
+            },
+        ],
+    }
+    if fold is not None:
+        spec["transform"] = [{"fold": list(fold), "as": [color["field"], y_field]}]
+    return spec
 
 
 def main():
     st.title("Agent and Call Peaks")
 
-    check_openpyxl()
+    check_excel_engine()
     
+    # Load the Excel file
+    data_path = "peaks.xlsx"
     try:
-        # Load the Excel file
-        data_path = "peaks.xlsx"
-        df = pd.read_excel(data_path)
+        mtime = os.path.getmtime(data_path)
         
-        # Filter out non-date rows and convert to datetime
-        df = df[df['Date'].apply(is_date_format)].copy()
-        df['Date'] = pd.to_datetime(df['Date'], format='%m/%d/%Y')
+        # Keep the loaded frame in the session so reruns skip the cache copy;
+        # it is shared across reruns, so it must not be modified in place below
+        if st.session_state.get('peaks_mtime') != mtime:
+            st.session_state['peaks'] = load_peaks(data_path, mtime)
+            st.session_state['peaks_mtime'] = mtime
+    except Exception as e:
+        st.error(f"An error occurred while loading data: {e}")
+        st.write("Please check that the data is in the correct format:")
+        st.write("1. Dates should be in MM/DD/YYYY format")
+        st.write("2. Only numeric values for peak counts")
+        st.stop()
+    
+    df, min_date, max_date = st.session_state['peaks']
+    
+    # Ensure we have valid data
+    if df.empty:
+        st.error("No valid data found in the Excel file.")
+        return
+    
+    # Calculate last updated info
+    est_time = last_updated()
+    
+    # Create a visually distinct data information section, sent as a single markdown element
+    st.markdown("<hr>"
+                "<h2 style='text-align: center; color: #1f77b4;'>Data Information</h2>"
+                "<div style='display: flex; gap: 1rem;'>"
+                "<div style='flex: 1; background-color: #f0f2f6; padding: 20px; border-radius: 10px;'>"
+                "<h3 style='color: #1f77b4;'>Data Date Range</h3>"
+                f"<p style='font-size: 18px;'>{min_date} to {max_date}</p>"
+                "</div>"
+                "<div style='flex: 1; background-color: #f0f2f6; padding: 20px; border-radius: 10px;'>"
+                "<h3 style='color: #1f77b4;'>Date Last Updated</h3>"
+                f"<p style='font-size: 18px;'>{est_time}</p>"
+                "</div>"
+                "</div>"
+                "<hr>", unsafe_allow_html=True)
         
-        # Calculate date range and last updated info
-        min_date = df['Date'].min().strftime('%m/%d/%Y')
-        max_date = df['Date'].max().strftime('%m/%d/%Y')
-        est_time = datetime.datetime.now(ZoneInfo("America/New_York")).strftime('%m/%d/%Y %I:%M %p EST')
+    # Data Overview
+    st.write("### Data")
+    # Only ship the first rows to the browser; the tabs below summarize the full frame
+    st.dataframe(df.head(PREVIEW_ROWS), height=400, use_container_width=True)
+    st.caption(f"Showing {min(PREVIEW_ROWS, len(df))} of {len(df):,} rows")
+    
+    chart_df, resolution = chart_data(df)
+    
+    # Summary statistics for every peak column, shared by both tabs.
+    # Computed directly in NumPy over one 2D array rather than through pandas' describe machinery.
+    # Blank cells are NaN and skipped, as describe() did.
+    values = df[PEAK_COLUMNS].to_numpy()
+    means = np.nanmean(values, axis=0)
+    stds = np.nanstd(values, axis=0, ddof=1)
+    median_vals, min_vals, max_vals = np.nanpercentile(values, [50, 0, 100], axis=0)
+    # Typical range is mean ± one standard deviation (roughly 68% of days)
+    lowers, uppers = means - stds, means + stds
+    # NaN compares False both ways, so blank days are never counted as outside
+    outside_counts = np.count_nonzero((values < lowers) | (values > uppers), axis=0)
+    stats_all = pd.DataFrame({
+        'mean': means,
+        'std': stds,
+        'median': median_vals,
+        'min': min_vals,
+        'max': max_vals,
+        'lower': lowers,
+        'upper': uppers,
+        'outside': outside_counts
+    }, index=PEAK_COLUMNS).T
+    
+    # Create tabs for different visualizations
+    tab1, tab2 = st.tabs(["Agent Peaks", "Call Peaks"])
+    
+    with tab1:
+        st.write("### Agent Peaks")
+        
+        agents_spec = hover_line_spec('Agents Peak', 'Number of Agents', f"{resolution} Agent Peak Values")
+        # Pass only the plotted columns; Streamlit ships the frame to the browser as Arrow
+        st.vega_lite_chart(chart_df[['Date', 'Agents Peak']], agents_spec, use_container_width=True)
         
-        # Create a visually distinct data information section
-        st.markdown("---")
-        st.markdown("<h2 style='text-align: center; color: #1f77b4;'>Data Information</h2>", unsafe_allow_html=True)
+        # Show agent peak statistics
+        st.write("### Agent Peak Statistics")
+        agent_stats = stats_all['Agents Peak']
+        mean_agents = agent_stats['mean']
+        std_dev = agent_stats['std']
+        median_agents = agent_stats['median']
+        
+        # Range where approximately 68% of values fall, and how many days fall outside it
+        lower_range = agent_stats['lower']
+        upper_range = agent_stats['upper']
+        days_outside_range = int(agent_stats['outside'])
+        total_days = len(df)
         
-        # Create two columns for better layout
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("<div style='background-color: #f0f2f6; padding: 20px; border-radius: 10px;'>"
-                       "<h3 style='color: #1f77b4;'>Data Date Range</h3>"
-                       f"<p style='font-size: 18px;'>{min_date} to {max_date}</p>"
-                       "</div>", unsafe_allow_html=True)
-            
+            st.metric("Median Daily Peak", f"{median_agents:.0f} agents")
+            st.metric("Maximum Peak", f"{agent_stats['max']:.0f} agents")
+            st.metric("Minimum Peak", f"{agent_stats['min']:.0f} agents")
+        
         with col2:
-            st.markdown("<div style='background-color: #f0f2f6; padding: 20px; border-radius: 10px;'>"
-                       "<h3 style='color: #1f77b4;'>Date Last Updated</h3>"
-                       f"<p style='font-size: 18px;'>{est_time}</p>"
-                       "</div>", unsafe_allow_html=True)
+            st.markdown(f"""
+                <div style='background-color: #f0f2f6; padding: 15px; border-radius: 10px;'>
+                    <h4 style='color: #1f77b4; margin-top: 0;'>Peak Staffing Patterns</h4>
+                    <p style='font-size: 16px;'>
+                    • Typical range: <strong>{lower_range:.0f}</strong> to <strong>{upper_range:.0f}</strong> agents<br>
+                    • Average (mean): <strong>{mean_agents:.0f}</strong> agents<br>
+                    • {days_outside_range} out of {total_days} days fall outside this range</p>
+                    <p style='font-size: 14px; color: #666;'>
+                    Note: The wide range suggests significant variation in peak staffing needs. 
+                    Consider checking specific days of the week or times of year for patterns.</p>
+                </div>
+            """, unsafe_allow_html=True)
+    
+    with tab2:
+        st.write("### Call Peak Analysis")
         
-        st.markdown("---")
+        # Create a combined chart for all call types with improved interaction
+        call_cols = ['Calls Peak', 'Calls Peak (Inbound)', 'Calls Peak (Outbound)']
+        calls_spec = hover_line_spec(
+            'Peak Value',
+            'Number of Calls',
+            f"{resolution} Call Peak Values by Type",
+            color={"field": "Call Type", "type": "nominal", "title": "Type"},
+            fold=call_cols
+        )
+        st.vega_lite_chart(chart_df[['Date'] + call_cols], calls_spec, use_container_width=True)
         
-        # Ensure we have valid data
-        if df.empty:
-            st.error("No valid data found in the Excel file.")
-            return
-            
-        # Data Overview
-        st.write("### Data")
-        st.dataframe(df)
+        # Show call peak statistics
+        st.write("### Call Peak Statistics")
         
-        # Create tabs for different visualizations
-        tab1, tab2 = st.tabs(["Agent Peaks", "Call Peaks"])
+        # Calculate statistics for each call type
+        call_types = {
+            'Total Calls': 'Calls Peak',
+            'Inbound Calls': 'Calls Peak (Inbound)',
+            'Outbound Calls': 'Calls Peak (Outbound)'
+        }
         
-        with tab1:
-            st.write("### Agent Peaks")
-            
-            # Create a selection that chooses the nearest point & selects based on x-position
-            nearest = alt.selection_point(nearest=True, on='mouseover',
-                                        fields=['Date'], empty=False)
-
-            # Create the base line
-            line = alt.Chart(df).mark_line(color='#1f77b4').encode(
-                x=alt.X('Date:T', title='Date'),
-                y=alt.Y('Agents Peak:Q', title='Number of Agents')
-            )
-
-            # Create the points
-            points = line.mark_point(size=100).encode(
-                opacity=alt.value(0)  # make the points transparent
-            ).add_params(
-                nearest
-            )
-
-            # Create a rule that highlights the date at the x-position of the cursor
-            rules = alt.Chart(df).mark_rule(color='gray').encode(
-                x='Date:T'
-            ).transform_filter(
-                nearest
-            )
-
-            # Create text labels that appear on hover
-            text = line.mark_text(
-                align='left',
-                dx=5,
-                dy=-5,
-                fontSize=12
-            ).encode(
-                text=alt.condition(nearest, 'Agents Peak:Q', alt.value(' '), format='.0f')
-            ).transform_filter(
-                nearest
-            )
-
-            # Combine all the layers
-            agents_chart = alt.layer(
-                line,
-                points,
-                rules,
-                text
-            ).properties(
-                width=800,
-                height=400,
-                title="Daily Agent Peak Values"
-            ).interactive()
-            
-            st.altair_chart(agents_chart, use_container_width=True)
-            
-            # Show agent peak statistics
-            st.write("### Agent Peak Statistics")
-            agent_stats = df['Agents Peak'].describe()
-            mean_agents = agent_stats['mean']
-            std_dev = agent_stats['std']
-            median_agents = agent_stats['50%']
-            
-            # Calculate the range where approximately 68% of values fall
-            lower_range = mean_agents - std_dev
-            upper_range = mean_agents + std_dev
-            
-            # Calculate how many days fall outside this range
-            days_outside_range = len(df[(df['Agents Peak'] < lower_range) | (df['Agents Peak'] > upper_range)])
-            total_days = len(df)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.metric("Median Daily Peak", f"{median_agents:.0f} agents")
-                st.metric("Maximum Peak", f"{agent_stats['max']:.0f} agents")
-                st.metric("Minimum Peak", f"{agent_stats['min']:.0f} agents")
-            
-            with col2:
-                st.markdown(f"""
-                    <div style='background-color: #f0f2f6; padding: 15px; border-radius: 10px;'>
-                        <h4 style='color: #1f77b4; margin-top: 0;'>Peak Staffing Patterns</h4>
-                        <p style='font-size: 16px;'>
-                        • Typical range: <strong>{lower_range:.0f}</strong> to <strong>{upper_range:.0f}</strong> agents<br>
-                        • Average (mean): <strong>{mean_agents:.0f}</strong> agents<br>
-                        • {days_outside_range} out of {total_days} days fall outside this range</p>
-                        <p style='font-size: 14px; color: #666;'>
-                        Note: The wide range suggests significant variation in peak staffing needs. 
-                        Consider checking specific days of the week or times of year for patterns.</p>
-                    </div>
-                """, unsafe_allow_html=True)
+        # Collect every card and send them to the browser as a single markdown element
+        cards = []
         
-        with tab2:
-            st.write("### Call Peak Analysis")
+        for call_type_display, call_type_col in call_types.items():
+            stats = stats_all[call_type_col]
+            mean_calls = stats['mean']
+            std_dev = stats['std']
+            median_calls = stats['median']
             
-            # Create a combined chart for all call types with improved interaction
-            call_data = pd.melt(
-                df,
-                id_vars=['Date'],
-                value_vars=['Calls Peak', 'Calls Peak (Inbound)', 'Calls Peak (Outbound)'],
-                var_name='Call Type',
-                value_name='Peak Value'
-            )
+            # Typical range and days outside it
+            lower_range = stats['lower']
+            upper_range = stats['upper']
+            days_outside = int(stats['outside'])
             
-            # Create selection for calls chart
-            nearest_calls = alt.selection_point(nearest=True, on='mouseover',
-                                              fields=['Date'], empty=False)
-
-            # Base lines for calls
-            calls_lines = alt.Chart(call_data).mark_line().encode(
-                x=alt.X('Date:T', title='Date'),
-                y=alt.Y('Peak Value:Q', title='Number of Calls'),
-                color=alt.Color('Call Type:N', title='Type')
-            )
-
-            # Points for calls
-            calls_points = calls_lines.mark_point(size=100).encode(
-                opacity=alt.value(0)
-            ).add_params(
-                nearest_calls
-            )
-
-            # Rules for calls
-            calls_rules = alt.Chart(call_data).mark_rule(color='gray').encode(
-                x='Date:T'
-            ).transform_filter(
-                nearest_calls
-            )
-
-            # Text for calls
-            calls_text = calls_lines.mark_text(
-                align='left',
-                dx=5,
-                dy=-5,
-                fontSize=12
-            ).encode(
-                text=alt.condition(nearest_calls, 'Peak Value:Q', alt.value(' '), format='.0f')
-            ).transform_filter(
-                nearest_calls
-            )
-
-            # Combine all layers for calls chart
-            calls_chart = alt.layer(
-                calls_lines,
-                calls_points,
-                calls_rules,
-                calls_text
-            ).properties(
-                width=800,
-                height=400,
-                title="Daily Call Peak Values by Type"
-            ).interactive()
-            
-            st.altair_chart(calls_chart, use_container_width=True)
-            
-            # Show call peak statistics
-            st.write("### Call Peak Statistics")
-            
-            # Calculate statistics for each call type
-            call_types = {
-                'Total Calls': 'Calls Peak',
-                'Inbound Calls': 'Calls Peak (Inbound)',
-                'Outbound Calls': 'Calls Peak (Outbound)'
-            }
-            
-            for call_type_display, call_type_col in call_types.items():
-                stats = df[call_type_col].describe()
-                mean_calls = stats['mean']
-                std_dev = stats['std']
-                median_calls = stats['50%']
-                
-                # Calculate typical range
-                lower_range = mean_calls - std_dev
-                upper_range = mean_calls + std_dev
-                
-                # Calculate days outside range
-                days_outside = len(df[(df[call_type_col] < lower_range) | (df[call_type_col] > upper_range)])
-                
-                st.markdown(f"""
-                    <div style='background-color: #f0f2f6; padding: 15px; border-radius: 10px; margin-bottom: 15px;'>
-                        <h4 style='color: #1f77b4; margin-top: 0;'>{call_type_display} Peak Patterns</h4>
-                        <div style='display: flex; justify-content: space-between;'>
-                            <div style='flex: 1;'>
-                                <p style='font-size: 16px; margin: 5px 0;'>
-                                • Median Peak: <strong>{median_calls:.0f}</strong> calls<br>
-                                • Average Peak: <strong>{mean_calls:.0f}</strong> calls<br>
-                                • Range: <strong>{stats['min']:.0f}</strong> to <strong>{stats['max']:.0f}</strong> calls
-                                </p>
-                            </div>
-                            <div style='flex: 1;'>
-                                <p style='font-size: 16px; margin: 5px 0;'>
-                                • Typical Range: <strong>{lower_range:.0f}</strong> to <strong>{upper_range:.0f}</strong> calls<br>
-                                • Standard Deviation: ±<strong>{std_dev:.1f}</strong> calls<br>
-                                • <strong>{days_outside}</strong> out of <strong>{len(df)}</strong> days outside typical range
-                                </p>
-                            </div>
+            cards.append(textwrap.dedent(f"""
+                <div style='background-color: #f0f2f6; padding: 15px; border-radius: 10px; margin-bottom: 15px;'>
+                    <h4 style='color: #1f77b4; margin-top: 0;'>{call_type_display} Peak Patterns</h4>
+                    <div style='display: flex; justify-content: space-between;'>
+                        <div style='flex: 1;'>
+                            <p style='font-size: 16px; margin: 5px 0;'>
+                            • Median Peak: <strong>{median_calls:.0f}</strong> calls<br>
+                            • Average Peak: <strong>{mean_calls:.0f}</strong> calls<br>
+                            • Range: <strong>{stats['min']:.0f}</strong> to <strong>{stats['max']:.0f}</strong> calls
+                            </p>
                         </div>
-                    </div>
-                """, unsafe_allow_html=True)
-                
-                # Calculate and display the ratio of inbound/outbound if this is the total calls section
-                if call_type_col == 'Calls Peak':
-                    inbound_ratio = (df['Calls Peak (Inbound)'] / df['Calls Peak']).mean() * 100
-                    outbound_ratio = (df['Calls Peak (Outbound)'] / df['Calls Peak']).mean() * 100
-                    st.markdown(f"""
-                        <div style='background-color: #e6f3ff; padding: 15px; border-radius: 10px; margin-bottom: 20px;'>
-                            <h4 style='color: #1f77b4; margin-top: 0;'>Call Type Distribution</h4>
-                            <p style='font-size: 16px;'>
-                            On average, during peak times:<br>
-                            • <strong>{inbound_ratio:.1f}%</strong> of calls are Inbound<br>
-                            • <strong>{outbound_ratio:.1f}%</strong> of calls are Outbound
+                        <div style='flex: 1;'>
+                            <p style='font-size: 16px; margin: 5px 0;'>
+                            • Typical Range: <strong>{lower_range:.0f}</strong> to <strong>{upper_range:.0f}</strong> calls<br>
+                            • Standard Deviation: ±<strong>{std_dev:.1f}</strong> calls<br>
+                            • <strong>{days_outside}</strong> out of <strong>{len(df)}</strong> days outside typical range
                             </p>
                         </div>
-                    """, unsafe_allow_html=True)
-                
-    except Exception as e:
-        st.error(f"An error occurred while loading data: {e}")
-        st.write("Please check that the data is in the correct format:")
-        st.write("1. Dates should be in MM/DD/YYYY format")
-        st.write("2. Only numeric values for peak counts")
+                    </div>
+                </div>
+            """))
+            
+            # Calculate and display the ratio of inbound/outbound if this is the total calls section
+            if call_type_col == 'Calls Peak':
+                # Volume-weighted share: ratio of column totals, no per-row temporary
+                total_calls = np.nansum(df['Calls Peak'].to_numpy())
+                inbound_ratio = np.nansum(df['Calls Peak (Inbound)'].to_numpy()) / total_calls * 100
+                outbound_ratio = np.nansum(df['Calls Peak (Outbound)'].to_numpy()) / total_calls * 100
+                cards.append(textwrap.dedent(f"""
+                    <div style='background-color: #e6f3ff; padding: 15px; border-radius: 10px; margin-bottom: 20px;'>
+                        <h4 style='color: #1f77b4; margin-top: 0;'>Call Type Distribution</h4>
+                        <p style='font-size: 16px;'>
+                        On average, during peak times:<br>
+                        • <strong>{inbound_ratio:.1f}%</strong> of calls are Inbound<br>
+                        • <strong>{outbound_ratio:.1f}%</strong> of calls are Outbound
+                        </p>
+                    </div>
+                """))
+        
+        st.markdown("\n".join(cards), unsafe_allow_html=True)
 
 
 if __name__ == "__main__":